@@ -1,36 +1,43 @@
 """API routes for Human Design time calculation."""
 
-from fastapi import APIRouter, Depends, Response
-from app.core.auth import require_auth
-from app.core.swe import calculate_sun_position
-from app.core.angle import normalize_angle, angle_difference, angle_within_tolerance
-from app.core.versioning import get_source_header
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Body, HTTPException
+from app.core.auth import AuthDep
+from app.core.swe import calculate_sun_position, initialize_ephemeris_path
+from app.core.angle import normalize_angle
+from app.core.design_time_solver import find_sun_longitude
+from app.core.responses import ORJSONResponse
 from app.core.errors import raise_no_convergence, raise_bad_request
 from app.models.requests import DesignTimeRequest
 from app.models.responses import DesignTimeResponse
 
 router = APIRouter()
 
+# Maximum number of births accepted by /v1/design-time/batch
+MAX_BATCH_SIZE = 1000
 
-@router.post("/v1/design-time", response_model=DesignTimeResponse, tags=["calculations"])
-async def calculate_design_time_endpoint(
-    request: DesignTimeRequest,
-    response: Response,
-    _token: str = Depends(require_auth),
-) -> DesignTimeResponse:
+# Sun's mean motion in ecliptic longitude (degrees/day), used for the initial guess
+SUN_MEAN_MOTION_DEG_PER_DAY = 0.9856
+
+# Bounds on the Sun's apparent longitude speed (degrees/day, observed range is
+# about 0.9528 near aphelion to 1.0199 near perihelion), used to bracket the search
+SUN_MIN_SPEED_DEG_PER_DAY = 0.95
+SUN_MAX_SPEED_DEG_PER_DAY = 1.02
+
+
+def _solve_design_time(request: DesignTimeRequest) -> Dict[str, Any]:
     """
     Find design_jd_ut for Human Design: moment before birth when Sun is at offset degrees earlier.
 
-    Uses binary search to find the moment when Sun's longitude equals
-    (birth_sun_lon - sun_offset_deg) mod 360.
+    Uses safeguarded Newton-Raphson iteration (driven by the Sun's longitude speed)
+    to find the moment when Sun's longitude equals (birth_sun_lon - sun_offset_deg) mod 360.
 
     Args:
         request: Design time calculation request
-        response: FastAPI response object (for headers)
-        _token: Authentication token (from dependency)
 
     Returns:
-        Design time with achieved accuracy
+        Design time response payload (see DesignTimeResponse)
 
     Raises:
         HTTPException: If convergence fails or calculation error occurs
@@ -55,56 +62,36 @@ async def calculate_design_time_endpoint(
     search_start_jd = request.birth_jd_ut - request.search_window_days.max
     search_end_jd = request.birth_jd_ut - request.search_window_days.min
 
-    # Binary search
-    iterations = 0
-    design_jd_ut = None
-    achieved_sun_lon = None
-
-    while iterations < request.max_iter:
-        iterations += 1
-
-        # Check if window is small enough
-        window_size = search_end_jd - search_start_jd
-        if window_size < 1e-6:  # Less than ~0.1 seconds
-            design_jd_ut = (search_start_jd + search_end_jd) / 2.0
-            try:
-                achieved_sun_lon = calculate_sun_position(design_jd_ut)
-                achieved_sun_lon = normalize_angle(achieved_sun_lon)
-            except Exception as e:
-                raise_bad_request(f"Error calculating design Sun position: {str(e)}")
-
-            delta = abs(angle_difference(achieved_sun_lon, target_sun_lon))
-            if angle_within_tolerance(achieved_sun_lon, target_sun_lon, request.tolerance_deg):
-                break
-
-        # Midpoint
-        mid_jd = (search_start_jd + search_end_jd) / 2.0
+    # The Sun covers sun_offset_deg in between offset/max_speed and offset/min_speed
+    # days, so narrow the window to that bracket when the two overlap
+    if request.sun_offset_deg > 0:
+        bracket_start_jd = max(
+            search_start_jd,
+            request.birth_jd_ut - request.sun_offset_deg / SUN_MIN_SPEED_DEG_PER_DAY,
+        )
+        bracket_end_jd = min(
+            search_end_jd,
+            request.birth_jd_ut - request.sun_offset_deg / SUN_MAX_SPEED_DEG_PER_DAY,
+        )
+        if bracket_start_jd < bracket_end_jd:
+            search_start_jd, search_end_jd = bracket_start_jd, bracket_end_jd
 
-        try:
-            mid_sun_lon = calculate_sun_position(mid_jd)
-            mid_sun_lon = normalize_angle(mid_sun_lon)
-        except Exception as e:
-            raise_bad_request(f"Error calculating mid Sun position: {str(e)}")
-
-        # Calculate difference (handling wrap-around)
-        diff = angle_difference(mid_sun_lon, target_sun_lon)
-
-        # Check convergence
-        if abs(diff) <= request.tolerance_deg:
-            design_jd_ut = mid_jd
-            achieved_sun_lon = mid_sun_lon
-            break
-
-        # Update search window
-        if diff > 0:
-            # Sun is ahead of target, need to go earlier
-            search_end_jd = mid_jd
-        else:
-            # Sun is behind target, need to go later
-            search_start_jd = mid_jd
+    # Safeguarded Newton-Raphson from the mean-motion estimate
+    initial_jd = request.birth_jd_ut - request.sun_offset_deg / SUN_MEAN_MOTION_DEG_PER_DAY
+    try:
+        design_jd_ut, achieved_sun_lon, delta, iterations = find_sun_longitude(
+            target_sun_lon,
+            search_start_jd,
+            search_end_jd,
+            initial_jd,
+            request.tolerance_deg,
+            request.max_iter,
+        )
+    except Exception as e:
+        raise_bad_request(f"Error calculating design Sun position: {str(e)}")
 
     # Check if we found a solution
-    if design_jd_ut is None or achieved_sun_lon is None:
+    if design_jd_ut is None or achieved_sun_lon is None or delta is None:
         raise_no_convergence(
             f"Failed to find design time within {request.max_iter} iterations",
             details={
@@ -117,26 +104,81 @@ async def calculate_design_time_endpoint(
             },
         )
 
-    # Final check
-    delta = abs(angle_difference(achieved_sun_lon, target_sun_lon))
-    if delta > request.tolerance_deg:
-        raise_no_convergence(
-            f"Failed to achieve tolerance: delta={delta:.6f} > tolerance={request.tolerance_deg}",
-            details={
-                "iterations": iterations,
-                "delta_deg": delta,
-                "tolerance_deg": request.tolerance_deg,
-            },
-        )
+    return {
+        "birth_jd_ut": request.birth_jd_ut,
+        "design_jd_ut": design_jd_ut,
+        "target_sun_lon": target_sun_lon,
+        "achieved_sun_lon": achieved_sun_lon,
+        "delta_deg": delta,
+        "iterations": iterations,
+    }
+
+
+@router.post(
+    "/v1/design-time",
+    response_model=None,
+    responses={200: {"model": DesignTimeResponse}},
+    tags=["calculations"],
+)
+async def calculate_design_time_endpoint(
+    request: DesignTimeRequest,
+    _token: str = AuthDep,
+) -> ORJSONResponse:
+    """
+    Find design_jd_ut for Human Design: moment before birth when Sun is at offset degrees earlier.
+
+    Args:
+        request: Design time calculation request
+        _token: Authentication token (from dependency)
+
+    Returns:
+        Design time with achieved accuracy
+
+    Raises:
+        HTTPException: If convergence fails or calculation error occurs
+    """
+    return ORJSONResponse(content=_solve_design_time(request))
+
+
+@router.post(
+    "/v1/design-time/batch",
+    response_model=None,
+    responses={200: {"model": List[DesignTimeResponse]}},
+    tags=["calculations"],
+)
+def calculate_design_time_batch_endpoint(
+    requests: List[DesignTimeRequest] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    _token: str = AuthDep,
+) -> ORJSONResponse:
+    """
+    Find design times for many births in one request.
+
+    Births are solved in order of birth_jd_ut so that consecutive Swiss Ephemeris
+    lookups fall on nearby dates; results are returned in request order. The
+    handler is synchronous so the solves run in the threadpool instead of
+    blocking the event loop.
+
+    Args:
+        requests: Design time calculation requests
+        _token: Authentication token (from dependency)
+
+    Returns:
+        List of design times, one per request
+
+    Raises:
+        HTTPException: If any request fails to converge or a calculation error occurs;
+            details.index is the position of the failing request
+    """
+    # Swiss Ephemeris state is per thread; set the path for this worker
+    initialize_ephemeris_path()
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+    for i in sorted(range(len(requests)), key=lambda i: requests[i].birth_jd_ut):
+        try:
+            results[i] = _solve_design_time(requests[i])
+        except HTTPException as e:
+            # Tell the client which birth failed
+            e.detail["error"]["details"]["index"] = i
+            raise
 
-    # Add X-AGPL-Source header
-    response.headers["X-AGPL-Source"] = get_source_header()
-
-    return DesignTimeResponse(
-        birth_jd_ut=request.birth_jd_ut,
-        design_jd_ut=design_jd_ut,
-        target_sun_lon=target_sun_lon,
-        achieved_sun_lon=achieved_sun_lon,
-        delta_deg=delta,
-        iterations=iterations,
-    )
+    return ORJSONResponse(content=results)
@@ -1,12 +1,27 @@
 """Meta endpoints (health, version, source) - no authentication required."""
 
-from fastapi import APIRouter
+from functools import cache
+
+import orjson
+from fastapi import APIRouter, Response
 from app.core.versioning import get_version_info, get_source_info
 from app.models.responses import VersionResponse, SourceResponse
 
 router = APIRouter()
 
 
+@cache
+def _version_json() -> bytes:
+    """Serialized /v1/version payload, validated against VersionResponse once."""
+    return orjson.dumps(VersionResponse(**get_version_info()).model_dump())
+
+
+@cache
+def _source_json() -> bytes:
+    """Serialized /v1/source payload, validated against SourceResponse once."""
+    return orjson.dumps(SourceResponse(**get_source_info()).model_dump())
+
+
 @router.get("/health", tags=["meta"])
 async def health_check() -> dict:
     """
@@ -18,25 +33,33 @@ async def health_check() -> dict:
     return {"ok": True}
 
 
-@router.get("/v1/version", response_model=VersionResponse, tags=["meta"])
-async def get_version() -> VersionResponse:
+@router.get(
+    "/v1/version",
+    response_model=None,
+    responses={200: {"model": VersionResponse}},
+    tags=["meta"],
+)
+async def get_version() -> Response:
     """
     Get version and build information.
 
     Returns:
         Version information including git commit, build tag, and build time
     """
-    version_info = get_version_info()
-    return VersionResponse(**version_info)
+    return Response(content=_version_json(), media_type="application/json")
 
 
-@router.get("/v1/source", response_model=SourceResponse, tags=["meta"])
-async def get_source() -> SourceResponse:
+@router.get(
+    "/v1/source",
+    response_model=None,
+    responses={200: {"model": SourceResponse}},
+    tags=["meta"],
+)
+async def get_source() -> Response:
     """
     Get source code information for AGPL compliance.
 
     Returns:
         Source code information including repository URL, tag, and commit
     """
-    source_info = get_source_info()
-    return SourceResponse(**source_info)
+    return Response(content=_source_json(), media_type="application/json")
@@ -1,36 +1,45 @@
 """API routes for planet positions calculation."""
 
-from fastapi import APIRouter, Depends, Response
-from app.core.auth import require_auth
-from app.core.swe import calculate_positions
-from app.core.angle import normalize_angle
-from app.core.versioning import get_source_header
-from app.core.errors import raise_bad_request, ErrorCode
-from app.models.requests import PositionsRequest
-from app.models.responses import PositionsResponse, PositionsMeta
+import numpy as np
+from fastapi import APIRouter
+from app.core.auth import AuthDep
+from app.core.swe import (
+    calculate_positions,
+    calculate_positions_vector,
+    initialize_ephemeris_path,
+)
+from app.core.responses import ORJSONResponse
+from app.models.requests import PositionsRequest, PositionsBatchRequest
+from app.models.responses import PositionsResponse, PositionsBatchResponse
 
 router = APIRouter()
 
 
-@router.post("/v1/positions", response_model=PositionsResponse, tags=["calculations"])
+# Response model documents the schema only; the payload is built as a plain dict
+# and rendered directly, skipping output validation and jsonable_encoder
+@router.post(
+    "/v1/positions",
+    response_model=None,
+    responses={200: {"model": PositionsResponse}},
+    tags=["calculations"],
+)
 async def calculate_positions_endpoint(
     request: PositionsRequest,
-    response: Response,
-    _token: str = Depends(require_auth),
-) -> PositionsResponse:
+    _token: str = AuthDep,
+) -> ORJSONResponse:
     """
     Calculate ecliptic longitudes for celestial bodies.
 
     Args:
         request: Positions calculation request
-        response: FastAPI response object (for headers)
         _token: Authentication token (from dependency)
 
     Returns:
         Positions of requested bodies in degrees (0-360)
 
     Raises:
-        HTTPException: If body is unsupported or calculation fails
+        UnsupportedBodyError: If body is unsupported (handled in app.main)
+        CalculationError: If calculation fails (handled in app.main)
     """
     # Extract flags
     flags = request.flags
@@ -38,35 +47,73 @@ async def calculate_positions_endpoint(
     ayanamsa = flags.ayanamsa if flags else None
     include_speed = flags.include_speed if flags else request.include_speed
 
-    try:
-        # Calculate positions
-        positions_raw = calculate_positions(
-            jd_ut=request.jd_ut,
-            bodies=request.bodies,
-            include_speed=include_speed,
-            sidereal=sidereal,
-            ayanamsa=ayanamsa,
-        )
-
-        # Normalize all angles to [0, 360)
-        positions = {body: normalize_angle(lon) for body, lon in positions_raw.items()}
-
-        # Add X-AGPL-Source header
-        response.headers["X-AGPL-Source"] = get_source_header()
-
-        return PositionsResponse(
-            jd_ut=request.jd_ut,
-            positions=positions,
-            meta=PositionsMeta(engine="swisseph", sidereal=sidereal),
-        )
-
-    except ValueError as e:
-        error_msg = str(e)
-        if "Unsupported body" in error_msg:
-            raise_bad_request(
-                error_msg,
-                details={"code": ErrorCode.UNSUPPORTED_BODY, "bodies": request.bodies},
-            )
-        raise_bad_request(error_msg)
-    except Exception as e:
-        raise_bad_request(f"Calculation error: {str(e)}")
+    # Calculate positions (already normalized to [0, 360))
+    positions = calculate_positions(
+        jd_ut=request.jd_ut,
+        bodies=request.bodies,
+        include_speed=include_speed,
+        sidereal=sidereal,
+        ayanamsa=ayanamsa,
+    )
+
+    return ORJSONResponse(
+        content={
+            "jd_ut": request.jd_ut,
+            "positions": positions,
+            "meta": {"engine": "swisseph", "sidereal": sidereal},
+        },
+    )
+
+
+@router.post(
+    "/v1/positions/batch",
+    response_model=None,
+    responses={200: {"model": PositionsBatchResponse}},
+    tags=["calculations"],
+)
+def calculate_positions_batch_endpoint(
+    request: PositionsBatchRequest,
+    _token: str = AuthDep,
+) -> ORJSONResponse:
+    """
+    Calculate ecliptic longitudes for celestial bodies at many Julian Days.
+
+    The handler is synchronous so the calculation runs in the threadpool
+    instead of blocking the event loop.
+
+    Args:
+        request: Batch positions calculation request
+        _token: Authentication token (from dependency)
+
+    Returns:
+        Per-body lists of positions in degrees (0-360), aligned with jd_ut
+
+    Raises:
+        UnsupportedBodyError: If body is unsupported (handled in app.main)
+        CalculationError: If calculation fails (handled in app.main)
+    """
+    # Swiss Ephemeris state is per thread; set the path for this worker
+    initialize_ephemeris_path()
+
+    # Extract flags
+    flags = request.flags
+    sidereal = flags.sidereal if flags else False
+    ayanamsa = flags.ayanamsa if flags else None
+    include_speed = flags.include_speed if flags else request.include_speed
+
+    # Calculate positions (NumPy arrays, serialized natively by ORJSONResponse)
+    positions = calculate_positions_vector(
+        jd_ut_array=np.asarray(request.jd_ut, dtype=np.float64),
+        bodies=request.bodies,
+        include_speed=include_speed,
+        sidereal=sidereal,
+        ayanamsa=ayanamsa,
+    )
+
+    return ORJSONResponse(
+        content={
+            "jd_ut": request.jd_ut,
+            "positions": positions,
+            "meta": {"engine": "swisseph", "sidereal": sidereal},
+        },
+    )
@@ -1,5 +1,6 @@
 """Angle normalization and conversion utilities."""
 
+from math import fmod
 from typing import Tuple
 
 
@@ -13,10 +14,8 @@ def normalize_angle(angle: float) -> float:
     Returns:
         Normalized angle in range [0, 360)
     """
-    normalized = angle % 360.0
-    if normalized < 0:
-        normalized += 360.0
-    return normalized
+    normalized = fmod(angle, 360.0)
+    return normalized + 360.0 if normalized < 0.0 else normalized
 
 
 def angle_difference(angle1: float, angle2: float) -> float:
@@ -30,7 +29,29 @@ def angle_difference(angle1: float, angle2: float) -> float:
     Returns:
         Difference in degrees, normalized to [-180, 180]
     """
-    diff = normalize_angle(angle1) - normalize_angle(angle2)
+    diff = fmod(angle1 - angle2, 360.0)
+    if diff > 180.0:
+        diff -= 360.0
+    elif diff < -180.0:
+        diff += 360.0
+    return diff
+
+
+def angle_diff_normalized(angle1: float, angle2: float) -> float:
+    """
+    Calculate shortest angular difference between two angles already in [0, 360).
+
+    Skips the normalization done by angle_difference; results are only correct
+    when both inputs are already normalized.
+
+    Args:
+        angle1: First angle in degrees, in [0, 360)
+        angle2: Second angle in degrees, in [0, 360)
+
+    Returns:
+        Difference in degrees, normalized to [-180, 180]
+    """
+    diff = angle1 - angle2
     if diff > 180.0:
         diff -= 360.0
     elif diff < -180.0:
@@ -50,8 +71,28 @@ def angle_within_tolerance(angle1: float, angle2: float, tolerance: float) -> bo
     Returns:
         True if angles are within tolerance
     """
-    diff = abs(angle_difference(angle1, angle2))
-    return diff <= tolerance
+    return abs(angle_difference(angle1, angle2)) <= tolerance
+
+
+def newton_step(x: float, residual: float, slope: float, lower: float, upper: float) -> float:
+    """
+    Take a safeguarded Newton-Raphson step inside a bracket.
+
+    Args:
+        x: Current estimate
+        residual: Function value at x
+        slope: Derivative at x
+        lower: Lower bound of the bracket containing the root
+        upper: Upper bound of the bracket containing the root
+
+    Returns:
+        Newton estimate, or the bracket midpoint if the step leaves (lower, upper)
+    """
+    if slope != 0.0:
+        x_next = x - residual / slope
+        if lower < x_next < upper:
+            return x_next
+    return (lower + upper) / 2.0
 
 
 def degrees_to_dms(degrees: float) -> Tuple[int, int, float]:
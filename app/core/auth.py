@@ -1,8 +1,10 @@
 """Authentication middleware for API endpoints."""
 
+import hmac
 import os
+from functools import lru_cache
 from typing import Optional
-from fastapi import Security, HTTPException, status
+from fastapi import Depends, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from .errors import raise_unauthorized
@@ -11,28 +13,37 @@ from .errors import raise_unauthorized
 security = HTTPBearer(auto_error=False)
 
 
-def get_api_keys() -> list[str]:
+def get_api_keys() -> frozenset[bytes]:
     """
     Get API keys from environment variables.
 
     Supports both AGPL_SERVICE_API_KEYS (comma-separated) and AGPL_SERVICE_API_KEY (single).
+    The environment is read on every call so keys can be changed at runtime, but
+    parsing is cached per distinct value.
 
     Returns:
-        List of API keys
+        Set of API keys encoded as UTF-8 bytes
     """
     keys_str = os.getenv("AGPL_SERVICE_API_KEYS") or os.getenv("AGPL_SERVICE_API_KEY")
     if not keys_str:
-        return []
+        return frozenset()
 
-    # Split by comma and strip whitespace
-    keys = [key.strip() for key in keys_str.split(",") if key.strip()]
-    return keys
+    return _parse_api_keys(keys_str)
+
+
+@lru_cache(maxsize=4)
+def _parse_api_keys(keys_str: str) -> frozenset[bytes]:
+    """Split comma-separated keys, strip whitespace and encode for comparison."""
+    return frozenset(key.strip().encode() for key in keys_str.split(",") if key.strip())
 
 
 def verify_token(token: str) -> bool:
     """
     Verify if token is valid.
 
+    Each key is compared with hmac.compare_digest so that the comparison time
+    does not depend on how many leading characters match.
+
     Args:
         token: Bearer token to verify
 
@@ -45,7 +56,8 @@ def verify_token(token: str) -> bool:
         # In production, this should be an error
         return True
 
-    return token in api_keys
+    token_bytes = token.encode()
+    return any(hmac.compare_digest(token_bytes, key) for key in api_keys)
 
 
 async def require_auth(
@@ -71,3 +83,7 @@ async def require_auth(
         raise_unauthorized("Invalid authorization token")
 
     return token
+
+
+# Shared dependency instance for protected routes: `_token: str = AuthDep`
+AuthDep = Depends(require_auth)
@@ -0,0 +1,62 @@
+"""Root finder for the Human Design design-time search."""
+
+from typing import Optional, Tuple
+
+from .angle import angle_diff_normalized, newton_step, normalize_angle
+from .swe import calculate_sun_motion
+
+
+def find_sun_longitude(
+    target_lon: float,
+    lower: float,
+    upper: float,
+    initial_jd: float,
+    tolerance: float,
+    max_iter: int,
+) -> Tuple[Optional[float], Optional[float], Optional[float], int]:
+    """
+    Find the Julian Day in (lower, upper) at which the Sun reaches target_lon.
+
+    Uses safeguarded Newton-Raphson iteration driven by the Sun's longitude
+    speed, falling back to bisection whenever a step would leave the bracket.
+
+    Args:
+        target_lon: Target Sun longitude in degrees, in [0, 360)
+        lower: Lower bound of the search bracket (Julian Day)
+        upper: Upper bound of the search bracket (Julian Day)
+        initial_jd: Initial guess; the bracket midpoint is used if it lies outside
+        tolerance: Convergence tolerance in degrees
+        max_iter: Maximum number of Sun position evaluations
+
+    Returns:
+        Tuple of (jd, achieved longitude, delta in degrees, iterations);
+        the first three are None if the search did not converge
+    """
+    jd = initial_jd
+    if not lower < jd < upper:
+        jd = (lower + upper) / 2.0
+
+    iterations = 0
+    while iterations < max_iter:
+        iterations += 1
+
+        sun_lon, sun_speed = calculate_sun_motion(jd)
+        sun_lon = normalize_angle(sun_lon)
+
+        # Both angles are normalized, so the cheaper difference is exact
+        diff = angle_diff_normalized(sun_lon, target_lon)
+        if abs(diff) <= tolerance:
+            return jd, sun_lon, abs(diff), iterations
+
+        # Shrink the bracket around the root
+        if diff > 0:
+            # Sun is ahead of target, need to go earlier
+            upper = jd
+        else:
+            # Sun is behind target, need to go later
+            lower = jd
+
+        # Newton step, falling back to bisection outside the bracket
+        jd = newton_step(jd, diff, sun_speed, lower, upper)
+
+    return None, None, None, iterations
@@ -2,7 +2,8 @@
 
 from typing import Any, Dict, Optional
 from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
+
+from .responses import ORJSONResponse
 
 
 class ErrorCode:
@@ -15,6 +16,33 @@ class ErrorCode:
     INVALID_BODY = "invalid_body"
     UNSUPPORTED_BODY = "unsupported_body"
     INVALID_HOUSE_SYSTEM = "invalid_house_system"
+    VALIDATION_ERROR = "validation_error"
+
+
+class UnsupportedBodyError(ValueError):
+    """Raised when a requested celestial body is not supported."""
+
+    def __init__(self, body_name: str):
+        super().__init__(body_name)
+        self.body_name = body_name
+
+    def __str__(self) -> str:
+        return f"Unsupported body: {self.body_name}"
+
+
+class UnsupportedHouseSystemError(ValueError):
+    """Raised when a requested house system is not supported."""
+
+    def __init__(self, house_system: str):
+        super().__init__(house_system)
+        self.house_system = house_system
+
+    def __str__(self) -> str:
+        return f"Unsupported house system: {self.house_system}"
+
+
+class CalculationError(RuntimeError):
+    """Raised when Swiss Ephemeris reports an error for a calculation."""
 
 
 def create_error_response(
@@ -22,7 +50,8 @@ def create_error_response(
     message: str,
     details: Optional[Dict[str, Any]] = None,
     status_code: int = status.HTTP_400_BAD_REQUEST,
-) -> JSONResponse:
+    headers: Optional[Dict[str, str]] = None,
+) -> ORJSONResponse:
     """
     Create standardized error response.
 
@@ -31,11 +60,12 @@ def create_error_response(
         message: Human-readable error message
         details: Optional additional details
         status_code: HTTP status code
+        headers: Optional response headers
 
     Returns:
-        JSONResponse with error format
+        ORJSONResponse with error format
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": {
@@ -44,6 +74,7 @@ def create_error_response(
                 "details": details or {},
             }
         },
+        headers=headers,
     )
 
 
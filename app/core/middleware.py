@@ -0,0 +1,34 @@
+"""ASGI middleware for API responses."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .versioning import get_source_header
+
+
+class AGPLSourceHeaderMiddleware:
+    """
+    Add the X-AGPL-Source header to every HTTP response.
+
+    The header is encoded once when the middleware is created and added to the
+    raw ASGI response headers, so per-request work is a single list build.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.header = (b"x-agpl-source", get_source_header().encode("latin-1"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = self.header
+
+        async def send_with_header(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Headers may be any iterable (e.g. a tuple) and may be the
+                # response's own list, so build a new list rather than append
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_header)
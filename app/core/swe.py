@@ -1,9 +1,15 @@
 """Swiss Ephemeris wrapper for astronomical calculations."""
 
 import os
-from typing import Dict, List, Optional, Tuple
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+import numpy as np
 import swisseph as swe
 
+from .angle import normalize_angle
+from .errors import CalculationError, UnsupportedBodyError, UnsupportedHouseSystemError
+
 # Swiss Ephemeris body constants
 BODY_CODES: Dict[str, int] = {
     # Classical planets
@@ -48,41 +54,107 @@ BODY_CODES: Dict[str, int] = {
     "WhiteMoon": 56,  # Alias for Selena
 }
 
-# House system codes (Swiss Ephemeris uses single-byte ASCII codes)
-# Reference: https://www.astro.com/swisseph/swephprg.htm#_Toc505244836
-HOUSE_SYSTEMS: Dict[str, bytes] = {
-    "P": b'P',  # Placidus
-    "K": b'K',  # Koch
-    "R": b'R',  # Regiomontanus
-    "C": b'C',  # Campanus
-    "E": b'E',  # Equal (cusp 1 = Asc)
-    "V": b'V',  # Vehlow equal (Asc in middle of house 1)
-    "W": b'W',  # Whole Sign
-    "X": b'X',  # Axial Rotation / Meridian
-    "H": b'H',  # Azimuthal / Horizontal
-    "T": b'T',  # Topocentric (Polich/Page)
-    "M": b'M',  # Morinus
-    "B": b'B',  # Alcabitius
-    "Y": b'Y',  # APC houses
-    "O": b'O',  # Porphyrius
+# Computed points: (base body, offset in degrees added to its longitude)
+COMPUTED_POINTS: Dict[str, Tuple[str, float]] = {
+    "SouthNode": ("TrueNode", 180.0),  # South Node (Ketu) = North Node + 180°
+    "SelenaLilith180": ("MeanLilith", 180.0),  # Alternative Selena (compatibility)
+}
+
+# Every accepted body name mapped to (Swiss Ephemeris code, longitude offset),
+# so resolving a body is a single dict probe with no branching
+_BODY_TABLE: Dict[str, Tuple[int, float]] = {
+    **{name: (code, 0.0) for name, code in BODY_CODES.items()},
+    **{name: (BODY_CODES[base], offset) for name, (base, offset) in COMPUTED_POINTS.items()},
 }
 
-_ephe_path_initialized = False
+# Supported house system codes (Swiss Ephemeris takes them as single-byte ASCII)
+# Reference: https://www.astro.com/swisseph/swephprg.htm#_Toc505244836
+HOUSE_SYSTEMS: FrozenSet[str] = frozenset(
+    {
+        "P",  # Placidus
+        "K",  # Koch
+        "R",  # Regiomontanus
+        "C",  # Campanus
+        "E",  # Equal (cusp 1 = Asc)
+        "V",  # Vehlow equal (Asc in middle of house 1)
+        "W",  # Whole Sign
+        "X",  # Axial Rotation / Meridian
+        "H",  # Azimuthal / Horizontal
+        "T",  # Topocentric (Polich/Page)
+        "M",  # Morinus
+        "B",  # Alcabitius
+        "Y",  # APC houses
+        "O",  # Porphyrius
+    }
+)
+
+# Swiss Ephemeris data file path, resolved once at import time
+SWEPH_PATH = os.getenv("SWEPH_PATH", "./sweph")
+
+
+# pyswisseph keeps the ephemeris path in thread-local storage, so it is
+# initialized once per thread that runs calculations
+_ephe_path_state = threading.local()
 
 
 def initialize_ephemeris_path() -> None:
     """
-    Initialize Swiss Ephemeris data file path.
+    Initialize Swiss Ephemeris data file path for the calling thread.
 
-    Must be called before any calculations.
+    Must be called before any calculations; the application lifespan does this
+    at startup, and synchronous handlers that run in the threadpool call it
+    for their worker thread. Only the first call in each thread does any work.
     """
-    global _ephe_path_initialized
-    if _ephe_path_initialized:
-        return
+    if not getattr(_ephe_path_state, "initialized", False):
+        swe.set_ephe_path(SWEPH_PATH)
+        _ephe_path_state.initialized = True
+
+
+# Calculation flags for calculate_positions, indexed by (include_speed << 1) | sidereal
+_FLAGS_NOSPEED = swe.FLG_SWIEPH
+_FLAGS_SPEED = swe.FLG_SWIEPH | swe.FLG_SPEED
+_FLAGS: Tuple[int, int, int, int] = (
+    _FLAGS_NOSPEED,
+    _FLAGS_NOSPEED | swe.FLG_SIDEREAL,
+    _FLAGS_SPEED,
+    _FLAGS_SPEED | swe.FLG_SIDEREAL,
+)
+
+# Ayanamsa last passed to swe.set_sid_mode. pyswisseph keeps Swiss Ephemeris
+# state (including the sidereal mode) in thread-local storage, so the record is
+# per thread as well.
+_sid_mode_state = threading.local()
 
-    sweph_path = os.getenv("SWEPH_PATH", "./sweph")
-    swe.set_ephe_path(sweph_path)
-    _ephe_path_initialized = True
+# Bounded cache of Swiss Ephemeris results. Julian Days are keyed in whole
+# microseconds so that the cache key is a deterministic integer.
+CALC_CACHE_SIZE = 8192
+_MICROSECONDS_PER_DAY = 86400e6
+
+
+@lru_cache(maxsize=CALC_CACHE_SIZE)
+def _calc_ut_cached(jd_key: int, body_code: int, flags: int) -> Tuple[Tuple[float, ...], int]:
+    """Cached swe.calc_ut keyed by Julian Day in microseconds."""
+    return swe.calc_ut(jd_key / _MICROSECONDS_PER_DAY, body_code, flags)
+
+
+def calc_ut(jd_ut: float, body_code: int, flags: int) -> Tuple[Tuple[float, ...], int]:
+    """
+    Call swe.calc_ut, serving repeated requests from the result cache.
+
+    Sidereal calculations bypass the cache because they depend on the global
+    ayanamsa set via swe.set_sid_mode, which is not part of the cache key.
+
+    Args:
+        jd_ut: Julian Day in UT
+        body_code: Swiss Ephemeris body code
+        flags: Calculation flags
+
+    Returns:
+        Tuple of (xx, retflag) as returned by swe.calc_ut
+    """
+    if flags & swe.FLG_SIDEREAL:
+        return swe.calc_ut(jd_ut, body_code, flags)
+    return _calc_ut_cached(round(jd_ut * _MICROSECONDS_PER_DAY), body_code, flags)
 
 
 def get_body_code(body_name: str) -> int:
@@ -96,12 +168,13 @@ def get_body_code(body_name: str) -> int:
         Swiss Ephemeris body code
 
     Raises:
-        ValueError: If body name is not supported
+        UnsupportedBodyError: If body name is not supported
     """
-    if body_name not in BODY_CODES:
-        raise ValueError(f"Unsupported body: {body_name}")
+    body_code = BODY_CODES.get(body_name)
+    if body_code is None:
+        raise UnsupportedBodyError(body_name)
 
-    return BODY_CODES[body_name]
+    return body_code
 
 
 def get_house_system_code(house_system: str) -> bytes:
@@ -115,18 +188,19 @@ def get_house_system_code(house_system: str) -> bytes:
         Swiss Ephemeris house system code as bytes
 
     Raises:
-        ValueError: If house system is not supported
+        UnsupportedHouseSystemError: If house system is not supported
     """
     if house_system not in HOUSE_SYSTEMS:
-        raise ValueError(f"Unsupported house system: {house_system}")
+        raise UnsupportedHouseSystemError(house_system)
 
-    return HOUSE_SYSTEMS[house_system]
+    # CPython caches single-byte bytes objects, so this does not allocate
+    return house_system.encode("ascii")
 
 
 def calculate_position(
     jd_ut: float,
     body_name: str,
-    flags: int = swe.FLG_SWIEPH | swe.FLG_SPEED,
+    flags: int = _FLAGS_SPEED,
 ) -> Tuple[float, Optional[float]]:
     """
     Calculate ecliptic longitude and speed of a celestial body.
@@ -137,29 +211,119 @@ def calculate_position(
         flags: Calculation flags (default includes speed)
 
     Returns:
-        Tuple of (longitude in degrees, speed in degrees/day or None)
+        Tuple of (longitude in degrees, speed in degrees/day, or None without FLG_SPEED)
     """
-    initialize_ephemeris_path()
-
     body_code = get_body_code(body_name)
 
     # pyswisseph.calc_ut returns (xx, retflag) where:
     # xx = tuple of 6 floats: [lon, lat, dist, lon_speed, lat_speed, dist_speed]
     # retflag = return flags (negative on error)
-    xx, retflag = swe.calc_ut(jd_ut, body_code, flags)
+    xx, retflag = calc_ut(jd_ut, body_code, flags)
 
     if retflag < 0:
-        raise RuntimeError(f"Swiss Ephemeris error {retflag} for {body_name}")
+        raise CalculationError(f"Swiss Ephemeris error {retflag} for {body_name}")
+
+    # xx always has 6 elements; speed is only meaningful with FLG_SPEED
+    return xx[0], (xx[3] if flags & swe.FLG_SPEED else None)
+
+
+def calculate_positions_array(
+    jd_ut: float,
+    body_codes: np.ndarray,
+    flags: int,
+) -> np.ndarray:
+    """
+    Calculate ecliptic longitudes for an array of Swiss Ephemeris body codes.
+
+    Args:
+        jd_ut: Julian Day in UT
+        body_codes: Array of Swiss Ephemeris body codes
+        flags: Calculation flags
+
+    Returns:
+        Array of longitudes in degrees (float64), in the order of body_codes
+    """
+    longitudes = np.empty(len(body_codes), dtype=np.float64)
+
+    # Local binding keeps the loop free of global lookups
+    calc = calc_ut
+
+    for i, body_code in enumerate(body_codes.tolist()):
+        xx, retflag = calc(jd_ut, body_code, flags)
+
+        if retflag < 0:
+            raise CalculationError(f"Swiss Ephemeris error {retflag} for body code {body_code}")
+
+        longitudes[i] = xx[0]
+
+    return longitudes
+
+
+# Number of distinct body lists kept by _resolve_bodies
+BODY_LIST_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=BODY_LIST_CACHE_SIZE)
+def _resolve_bodies(bodies: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resolve body names to Swiss Ephemeris codes and longitude offsets.
+
+    Results are cached per body list (in request order, since the arrays are
+    positional) and returned as read-only arrays shared between requests.
+
+    Args:
+        bodies: Body names
+
+    Returns:
+        Tuple of (int32 array of body codes, float64 array of offsets in degrees)
+
+    Raises:
+        UnsupportedBodyError: If any body name is not supported
+    """
+    body_codes = np.empty(len(bodies), dtype=np.int32)
+    offsets = np.zeros(len(bodies), dtype=np.float64)
+
+    # Local binding keeps the loop free of global lookups
+    table = _BODY_TABLE
+
+    # One try around the whole loop; Selena (code 56) resolves like any direct body
+    try:
+        for i, body_name in enumerate(bodies):
+            body_codes[i], offsets[i] = table[body_name]
+    except KeyError:
+        raise UnsupportedBodyError(body_name) from None
+
+    body_codes.setflags(write=False)
+    offsets.setflags(write=False)
+
+    return body_codes, offsets
 
-    longitude = xx[0]  # Ecliptic longitude
-    speed = xx[3] if len(xx) > 3 else None  # Longitude speed
 
-    return longitude, speed
+def _positions_flags(include_speed: bool, sidereal: bool, ayanamsa: Optional[int]) -> int:
+    """
+    Look up calculation flags and activate the ayanamsa for sidereal calculations.
+
+    Args:
+        include_speed: Whether to include speed in results
+        sidereal: Whether to use sidereal zodiac
+        ayanamsa: Ayanamsa code for sidereal calculations
+
+    Returns:
+        Swiss Ephemeris calculation flags
+    """
+    flags = _FLAGS[(include_speed << 1) | sidereal]
+
+    # Skip the state change when this thread already has the ayanamsa active
+    if sidereal and ayanamsa is not None and ayanamsa != getattr(_sid_mode_state, "ayanamsa", None):
+        swe.set_sid_mode(ayanamsa, 0, 0)
+        _sid_mode_state.ayanamsa = ayanamsa
+
+    return flags
 
 
 def calculate_positions(
     jd_ut: float,
-    bodies: List[str],
+    bodies: Sequence[str],
     include_speed: bool = False,
     sidereal: bool = False,
     ayanamsa: Optional[int] = None,
@@ -169,45 +333,79 @@ def calculate_positions(
 
     Args:
         jd_ut: Julian Day in UT
-        bodies: List of body names
+        bodies: Body names
+        include_speed: Whether to include speed in results
+        sidereal: Whether to use sidereal zodiac
+        ayanamsa: Ayanamsa code for sidereal calculations
+
+    Returns:
+        Dictionary mapping body names to longitudes normalized to [0, 360)
+
+    Raises:
+        UnsupportedBodyError: If any body name is not supported
+    """
+    body_codes, offsets = _resolve_bodies(tuple(bodies))
+    flags = _positions_flags(include_speed, sidereal, ayanamsa)
+
+    longitudes = calculate_positions_array(jd_ut, body_codes, flags)
+
+    # Apply offsets and normalize all angles to [0, 360) in one vectorized step
+    longitudes = np.mod(longitudes + offsets, 360.0)
+
+    return dict(zip(bodies, longitudes.tolist()))
+
+
+def calculate_positions_vector(
+    jd_ut_array: np.ndarray,
+    bodies: Sequence[str],
+    include_speed: bool = False,
+    sidereal: bool = False,
+    ayanamsa: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate positions for multiple celestial bodies at many Julian Days.
+
+    Bodies are resolved once and looped on the outside; for bulk time series
+    the result cache is bypassed since its entries would rarely be reused.
+
+    Args:
+        jd_ut_array: Julian Days in UT
+        bodies: Body names
         include_speed: Whether to include speed in results
         sidereal: Whether to use sidereal zodiac
         ayanamsa: Ayanamsa code for sidereal calculations
 
     Returns:
-        Dictionary mapping body names to longitudes (and optionally speeds)
+        Dictionary mapping body names to float64 arrays of longitudes in [0, 360),
+        aligned with jd_ut_array
+
+    Raises:
+        UnsupportedBodyError: If any body name is not supported
+        CalculationError: If Swiss Ephemeris reports an error
     """
-    flags = swe.FLG_SWIEPH
-    if include_speed:
-        flags |= swe.FLG_SPEED
-
-    if sidereal:
-        flags |= swe.FLG_SIDEREAL
-        if ayanamsa is not None:
-            swe.set_sid_mode(ayanamsa, 0, 0)
-
-    positions: Dict[str, float] = {}
-
-    for body_name in bodies:
-        try:
-            # Special computed points
-            if body_name == "SouthNode":
-                # South Node (Ketu) = North Node + 180°
-                north_node_lon, _ = calculate_position(jd_ut, "TrueNode", flags)
-                longitude = (north_node_lon + 180.0) % 360.0
-            elif body_name == "SelenaLilith180":
-                # Alternative Selena calculation: Lilith + 180° (for compatibility)
-                lilith_lon, _ = calculate_position(jd_ut, "MeanLilith", flags)
-                longitude = (lilith_lon + 180.0) % 360.0
-            else:
-                # All other bodies including Selena (code 56) from Swiss Ephemeris
-                longitude, _ = calculate_position(jd_ut, body_name, flags)
-
-            positions[body_name] = longitude
-        except (ValueError, RuntimeError) as e:
-            raise ValueError(f"Error calculating {body_name}: {str(e)}")
-
-    return positions
+    body_codes, offsets = _resolve_bodies(tuple(bodies))
+    flags = _positions_flags(include_speed, sidereal, ayanamsa)
+
+    jd_values = np.asarray(jd_ut_array, dtype=np.float64).tolist()
+    longitudes = np.empty((len(bodies), len(jd_values)), dtype=np.float64)
+
+    # Local binding keeps the inner loop free of global and attribute lookups
+    calc = swe.calc_ut
+
+    for row, body_code in zip(longitudes, body_codes.tolist()):
+        for j, jd_ut in enumerate(jd_values):
+            xx, retflag = calc(jd_ut, body_code, flags)
+
+            if retflag < 0:
+                raise CalculationError(f"Swiss Ephemeris error {retflag} for body code {body_code}")
+
+            row[j] = xx[0]
+
+    # Apply offsets and normalize all angles to [0, 360) in one vectorized step
+    longitudes += offsets[:, np.newaxis]
+    np.mod(longitudes, 360.0, out=longitudes)
+
+    return dict(zip(bodies, longitudes))
 
 
 def calculate_houses(
@@ -226,10 +424,9 @@ def calculate_houses(
         house_system: House system code (default: "P" for Placidus)
 
     Returns:
-        Tuple of (cusps list with 13 elements, angles dict with "asc" and "mc")
+        Tuple of (cusps list with 13 elements, angles dict with "asc" and "mc"),
+        all normalized to [0, 360)
     """
-    initialize_ephemeris_path()
-
     house_system_code = get_house_system_code(house_system)
 
     # Calculate houses using pyswisseph
@@ -238,15 +435,37 @@ def calculate_houses(
     # ascmc_tuple: [0]=Asc, [1]=MC, [2]=ARMC, [3]=Vertex, [4]=equatorial Asc, etc.
     cusps, ascmc = swe.houses(jd_ut, lat, lon, house_system_code)
 
-    # Convert to list and prepend 0 to match expected format (index = house number)
-    cusps_list = [0.0] + list(cusps)
+    # Prepend 0 to match expected format (index = house number) and normalize
+    # all cusps to [0, 360) in place with one vectorized call
+    house_cusps = np.empty(len(cusps) + 1, dtype=np.float64)
+    house_cusps[0] = 0.0
+    house_cusps[1:] = cusps
+    np.mod(house_cusps, 360.0, out=house_cusps)
 
     angles = {
-        "asc": ascmc[0],  # Ascendant
-        "mc": ascmc[1],  # MC (Midheaven)
+        "asc": normalize_angle(ascmc[0]),  # Ascendant
+        "mc": normalize_angle(ascmc[1]),  # MC (Midheaven)
     }
 
-    return cusps_list, angles
+    return house_cusps.tolist(), angles
+
+
+@lru_cache(maxsize=CALC_CACHE_SIZE)
+def _sun_motion_cached(jd_key: int) -> Tuple[float, float]:
+    """Cached Sun longitude and speed keyed by Julian Day in microseconds."""
+    jd_ut = jd_key / _MICROSECONDS_PER_DAY
+    xx, retflag = swe.calc_ut(jd_ut, swe.SUN, _FLAGS_SPEED)
+
+    if retflag < 0:
+        raise CalculationError(f"Swiss Ephemeris error {retflag} for Sun")
+
+    return xx[0], xx[3]
+
+
+def clear_caches() -> None:
+    """Drop all cached Swiss Ephemeris results."""
+    _calc_ut_cached.cache_clear()
+    _sun_motion_cached.cache_clear()
 
 
 def calculate_sun_position(jd_ut: float) -> float:
@@ -259,5 +478,20 @@ def calculate_sun_position(jd_ut: float) -> float:
     Returns:
         Sun's longitude in degrees
     """
-    longitude, _ = calculate_position(jd_ut, "Sun")
-    return longitude
+    return _sun_motion_cached(round(jd_ut * _MICROSECONDS_PER_DAY))[0]
+
+
+def calculate_sun_motion(jd_ut: float) -> Tuple[float, float]:
+    """
+    Calculate Sun's ecliptic longitude and longitude speed.
+
+    Results are memoized per microsecond of jd_ut, so repeated design-time
+    searches around the same dates skip Swiss Ephemeris entirely.
+
+    Args:
+        jd_ut: Julian Day in UT
+
+    Returns:
+        Tuple of (longitude in degrees, speed in degrees/day)
+    """
+    return _sun_motion_cached(round(jd_ut * _MICROSECONDS_PER_DAY))
@@ -1,13 +1,18 @@
 """Version and build information."""
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=1)
 def get_version_info() -> Dict[str, Any]:
     """
     Get version and build information.
 
+    Build variables are fixed for the process lifetime, so the result is
+    computed once; callers must not mutate the returned dictionary.
+
     Returns:
         Dictionary with version info
     """
@@ -20,10 +25,13 @@ def get_version_info() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_source_info() -> Dict[str, Any]:
     """
     Get source code information for AGPL compliance.
 
+    Computed once, like get_version_info; callers must not mutate the result.
+
     Returns:
         Dictionary with source info (repo, tag, commit, license)
     """
@@ -40,6 +48,7 @@ def get_source_info() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_source_header() -> str:
     """
     Get X-AGPL-Source header value.
@@ -1,17 +1,43 @@
 """FastAPI application entry point."""
 
 import os
+from contextlib import asynccontextmanager
+from http import HTTPStatus
 from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from swisseph import Error as SwissEphemerisError
 
 from app.api import v1
-from app.core.swe import initialize_ephemeris_path
-from app.core.errors import create_error_response
+from app.core.swe import clear_caches, initialize_ephemeris_path
+from app.core.middleware import AGPLSourceHeaderMiddleware
+from app.core.responses import ORJSONResponse
+from app.core.versioning import get_source_header
+from app.core.errors import (
+    CalculationError,
+    ErrorCode,
+    UnsupportedBodyError,
+    UnsupportedHouseSystemError,
+    create_error_response,
+)
 
-# Initialize Swiss Ephemeris path on startup
+# Initialize Swiss Ephemeris path on import, so calculations never do it lazily
 initialize_ephemeris_path()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize on startup and clean up on shutdown."""
+    # Ensure ephemeris path is initialized before the first request
+    initialize_ephemeris_path()
+    print("Ephemeris AGPL Service started")
+    yield
+    clear_caches()
+    print("Ephemeris AGPL Service stopped")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Ephemeris AGPL Service",
@@ -19,6 +45,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -33,31 +61,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Attach the X-AGPL-Source header to every response
+app.add_middleware(AGPLSourceHeaderMiddleware)
+
 # Include API routers
 app.include_router(v1.router)
 
 
+# All errors share one envelope: {"error": {"code", "message", "details"}}
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request, exc):
+    """Render HTTP exceptions, including those from the raise_* helpers, in the error envelope."""
+    if isinstance(exc.detail, dict) and "error" in exc.detail:
+        # raise_* helpers already build the envelope; return it at the top level
+        return ORJSONResponse(
+            status_code=exc.status_code,
+            content=exc.detail,
+            headers=exc.headers,
+        )
+
+    return create_error_response(
+        code=HTTPStatus(exc.status_code).phrase.lower().replace(" ", "_"),
+        message=str(exc.detail),
+        status_code=exc.status_code,
+        headers=exc.headers,
+    )
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request, exc):
+    """Handle request body and parameter validation errors."""
+    return create_error_response(
+        code=ErrorCode.VALIDATION_ERROR,
+        message="Request validation failed",
+        details={"errors": jsonable_encoder(exc.errors())},
+        status_code=422,
+    )
+
+
+# Calculation errors raised by app.core.swe, translated into 400 responses
+@app.exception_handler(UnsupportedBodyError)
+async def unsupported_body_handler(request, exc):
+    """Handle unsupported celestial body names."""
+    return create_error_response(
+        code=ErrorCode.UNSUPPORTED_BODY,
+        message=str(exc),
+        details={"body": exc.body_name},
+    )
+
+
+@app.exception_handler(UnsupportedHouseSystemError)
+async def unsupported_house_system_handler(request, exc):
+    """Handle unsupported house system codes."""
+    return create_error_response(
+        code=ErrorCode.INVALID_HOUSE_SYSTEM,
+        message=str(exc),
+        details={"house_system": exc.house_system},
+    )
+
+
+@app.exception_handler(CalculationError)
+@app.exception_handler(SwissEphemerisError)
+async def calculation_error_handler(request, exc):
+    """Handle errors reported by Swiss Ephemeris."""
+    return create_error_response(
+        code=ErrorCode.BAD_REQUEST,
+        message=f"Calculation error: {str(exc)}",
+    )
+
+
 # Global exception handler for unhandled errors
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Handle unhandled exceptions."""
+    # 500 responses are built by ServerErrorMiddleware, outside
+    # AGPLSourceHeaderMiddleware, so the header is added here
     return create_error_response(
-        code="internal_error",
+        code=ErrorCode.INTERNAL_ERROR,
         message="Internal server error",
         details={"error": str(exc)},
         status_code=500,
+        headers={"X-AGPL-Source": get_source_header()},
     )
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize on startup."""
-    # Ensure ephemeris path is initialized
-    initialize_ephemeris_path()
-    print("Ephemeris AGPL Service started")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    print("Ephemeris AGPL Service stopped")
@@ -1,12 +1,27 @@
 """Pydantic models for API requests."""
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Request models validate JSON input strictly (no str -> number coercion) and
+# reject unknown fields
+STRICT_CONFIG = ConfigDict(strict=True, extra="forbid", validate_default=False)
+
+# Limits for /v1/positions/batch: each timestamp is computed for every body,
+# so the total number of calculations is capped as well
+MAX_BATCH_JD_UT = 10000
+MAX_BATCH_BODIES = 64
+MAX_BATCH_CALCULATIONS = 100000
+
+# Julian Day in UT; the range check runs inside pydantic-core
+JulianDay = Annotated[float, Field(ge=0)]
 
 
 class PositionsFlags(BaseModel):
     """Flags for positions calculation."""
 
+    model_config = STRICT_CONFIG
+
     sidereal: bool = Field(default=False, description="Use sidereal zodiac")
     ayanamsa: Optional[int] = Field(default=None, description="Ayanamsa code for sidereal")
     include_speed: bool = Field(default=False, description="Include speed in results")
@@ -15,16 +30,52 @@ class PositionsFlags(BaseModel):
 class PositionsRequest(BaseModel):
     """Request model for positions calculation."""
 
-    jd_ut: float = Field(..., description="Julian Day in UT", ge=0)
-    bodies: List[str] = Field(..., description="List of celestial bodies to calculate")
+    model_config = STRICT_CONFIG
+
+    jd_ut: JulianDay = Field(..., description="Julian Day in UT")
+    # JSON arrays arrive as lists, so the tuple conversion is exempt from strict mode
+    bodies: Tuple[str, ...] = Field(
+        ..., description="List of celestial bodies to calculate", strict=False
+    )
+    flags: Optional[PositionsFlags] = Field(default=None, description="Calculation flags")
+    include_speed: bool = Field(default=False, description="Include speed in results")
+
+
+class PositionsBatchRequest(BaseModel):
+    """Request model for positions calculation at many Julian Days."""
+
+    model_config = STRICT_CONFIG
+
+    jd_ut: List[JulianDay] = Field(
+        ..., description="Julian Days in UT", min_length=1, max_length=MAX_BATCH_JD_UT
+    )
+    # JSON arrays arrive as lists, so the tuple conversion is exempt from strict mode
+    bodies: Tuple[str, ...] = Field(
+        ...,
+        description="List of celestial bodies to calculate",
+        strict=False,
+        max_length=MAX_BATCH_BODIES,
+    )
     flags: Optional[PositionsFlags] = Field(default=None, description="Calculation flags")
     include_speed: bool = Field(default=False, description="Include speed in results")
 
+    @model_validator(mode="after")
+    def check_calculation_count(self) -> "PositionsBatchRequest":
+        """Reject batches whose timestamps x bodies exceed MAX_BATCH_CALCULATIONS."""
+        calculations = len(self.jd_ut) * len(self.bodies)
+        if calculations > MAX_BATCH_CALCULATIONS:
+            raise ValueError(
+                f"len(jd_ut) * len(bodies) = {calculations} exceeds {MAX_BATCH_CALCULATIONS}"
+            )
+        return self
+
 
 class HousesRequest(BaseModel):
     """Request model for houses calculation."""
 
-    jd_ut: float = Field(..., description="Julian Day in UT", ge=0)
+    model_config = STRICT_CONFIG
+
+    jd_ut: JulianDay = Field(..., description="Julian Day in UT")
     lat: float = Field(..., description="Latitude in degrees", ge=-90, le=90)
     lon: float = Field(..., description="Longitude in degrees", ge=-180, le=180)
     house_system: str = Field(default="P", description="House system code (P=Placidus)")
@@ -33,6 +84,8 @@ class HousesRequest(BaseModel):
 class SearchWindowDays(BaseModel):
     """Search window for design time calculation."""
 
+    model_config = STRICT_CONFIG
+
     min: int = Field(..., description="Minimum days before birth", ge=0)
     max: int = Field(..., description="Maximum days before birth", ge=0)
 
@@ -40,7 +93,9 @@ class SearchWindowDays(BaseModel):
 class DesignTimeRequest(BaseModel):
     """Request model for design time calculation."""
 
-    birth_jd_ut: float = Field(..., description="Birth Julian Day in UT", ge=0)
+    model_config = STRICT_CONFIG
+
+    birth_jd_ut: JulianDay = Field(..., description="Birth Julian Day in UT")
     sun_offset_deg: float = Field(default=88.0, description="Solar arc offset in degrees")
     search_window_days: SearchWindowDays = Field(
         ..., description="Search window for design time"
@@ -19,6 +19,16 @@ class PositionsResponse(BaseModel):
     meta: PositionsMeta = Field(..., description="Calculation metadata")
 
 
+class PositionsBatchResponse(BaseModel):
+    """Response model for positions calculation at many Julian Days."""
+
+    jd_ut: List[float] = Field(..., description="Julian Days in UT")
+    positions: Dict[str, List[float]] = Field(
+        ..., description="Body positions in degrees, aligned with jd_ut"
+    )
+    meta: PositionsMeta = Field(..., description="Calculation metadata")
+
+
 class HousesAngles(BaseModel):
     """Angles (Ascendant, MC) for houses response."""
 
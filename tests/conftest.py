@@ -0,0 +1,38 @@
+"""Shared fixtures for API tests."""
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+
+# API key configured for the whole test session
+TEST_API_KEY = "test-token"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_keys_env():
+    """Configure the test API key once for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AGPL_SERVICE_API_KEYS", TEST_API_KEY)
+        yield TEST_API_KEY
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client shared by all tests."""
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """Async client calling the app in-process over one shared ASGI transport."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def auth_token(api_keys_env):
+    """Get auth token for tests."""
+    return api_keys_env
@@ -1,21 +1,16 @@
 """Tests for authentication."""
 
 import pytest
-import os
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-
-def test_health_no_auth():
+def test_health_no_auth(client):
     """Test that health endpoint doesn't require auth."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"ok": True}
 
 
-def test_version_no_auth():
+def test_version_no_auth(client):
     """Test that version endpoint doesn't require auth."""
     response = client.get("/v1/version")
     assert response.status_code == 200
@@ -24,7 +19,7 @@ def test_version_no_auth():
     assert "api_version" in data
 
 
-def test_source_no_auth():
+def test_source_no_auth(client):
     """Test that source endpoint doesn't require auth."""
     response = client.get("/v1/source")
     assert response.status_code == 200
@@ -34,9 +29,8 @@ def test_source_no_auth():
     assert data["license"] == "AGPL-3.0"
 
 
-def test_positions_without_token():
+def test_positions_without_token(client):
     """Test that positions endpoint requires token."""
-    os.environ["AGPL_SERVICE_API_KEYS"] = "test-token"
     response = client.post(
         "/v1/positions",
         json={
@@ -47,9 +41,8 @@ def test_positions_without_token():
     assert response.status_code == 401
 
 
-def test_positions_invalid_token():
+def test_positions_invalid_token(client):
     """Test that invalid token is rejected."""
-    os.environ["AGPL_SERVICE_API_KEYS"] = "test-token"
     response = client.post(
         "/v1/positions",
         json={
@@ -61,9 +54,8 @@ def test_positions_invalid_token():
     assert response.status_code == 401
 
 
-def test_positions_valid_token():
+def test_positions_valid_token(client):
     """Test that valid token is accepted."""
-    os.environ["AGPL_SERVICE_API_KEYS"] = "test-token"
     response = client.post(
         "/v1/positions",
         json={
@@ -75,11 +67,12 @@ def test_positions_valid_token():
     assert response.status_code == 200
 
 
-def test_positions_multiple_keys():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_positions_multiple_keys(aclient, monkeypatch):
     """Test that multiple keys work (comma-separated)."""
-    os.environ["AGPL_SERVICE_API_KEYS"] = "key1,key2,key3"
+    monkeypatch.setenv("AGPL_SERVICE_API_KEYS", "key1,key2,key3")
     # Test with first key
-    response = client.post(
+    response = await aclient.post(
         "/v1/positions",
         json={
             "jd_ut": 2451545.0,
@@ -90,7 +83,7 @@ def test_positions_multiple_keys():
     assert response.status_code == 200
 
     # Test with second key
-    response = client.post(
+    response = await aclient.post(
         "/v1/positions",
         json={
             "jd_ut": 2451545.0,
@@ -101,7 +94,7 @@ def test_positions_multiple_keys():
     assert response.status_code == 200
 
     # Test with third key
-    response = client.post(
+    response = await aclient.post(
         "/v1/positions",
         json={
             "jd_ut": 2451545.0,
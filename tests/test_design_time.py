@@ -1,24 +1,10 @@
 """Tests for design time calculation endpoint."""
 
-import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
-
 # Test Julian Day for 2000-01-01 12:00:00 UT
 TEST_BIRTH_JD_UT = 2451545.0
 
 
-@pytest.fixture
-def auth_token():
-    """Get auth token for tests."""
-    import os
-    os.environ["AGPL_SERVICE_API_KEYS"] = "test-token"
-    return "test-token"
-
-
-def test_design_time_without_auth():
+def test_design_time_without_auth(client):
     """Test that design-time endpoint requires authentication."""
     response = client.post(
         "/v1/design-time",
@@ -33,7 +19,7 @@ def test_design_time_without_auth():
     assert response.status_code == 401
 
 
-def test_design_time_success(auth_token):
+def test_design_time_success(client, auth_token):
     """Test successful design time calculation."""
     response = client.post(
         "/v1/design-time",
@@ -58,7 +44,7 @@ def test_design_time_success(auth_token):
     assert "X-AGPL-Source" in response.headers
 
 
-def test_design_time_tolerance(auth_token):
+def test_design_time_tolerance(client, auth_token):
     """Test that delta is within tolerance."""
     response = client.post(
         "/v1/design-time",
@@ -76,7 +62,26 @@ def test_design_time_tolerance(auth_token):
     assert abs(data["delta_deg"]) <= 0.01
 
 
-def test_design_time_invalid_window(auth_token):
+def test_design_time_tight_tolerance(client, auth_token):
+    """Test that Newton iteration reaches a tight tolerance in few iterations."""
+    response = client.post(
+        "/v1/design-time",
+        json={
+            "birth_jd_ut": TEST_BIRTH_JD_UT,
+            "sun_offset_deg": 88.0,
+            "search_window_days": {"min": 70, "max": 110},
+            "tolerance_deg": 0.000001,
+            "max_iter": 80,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["delta_deg"] <= 0.000001
+    assert data["iterations"] <= 10
+
+
+def test_design_time_invalid_window(client, auth_token):
     """Test error for invalid search window."""
     response = client.post(
         "/v1/design-time",
@@ -94,7 +99,7 @@ def test_design_time_invalid_window(auth_token):
     assert "error" in data
 
 
-def test_design_time_no_convergence(auth_token):
+def test_design_time_no_convergence(client, auth_token):
     """Test error when convergence fails."""
     response = client.post(
         "/v1/design-time",
@@ -113,3 +118,94 @@ def test_design_time_no_convergence(auth_token):
         data = response.json()
         assert "error" in data
         assert data["error"]["code"] == "no_convergence"
+
+
+def test_design_time_batch_without_auth(client):
+    """Test that batch design-time endpoint requires authentication."""
+    response = client.post(
+        "/v1/design-time/batch",
+        json=[
+            {
+                "birth_jd_ut": TEST_BIRTH_JD_UT,
+                "search_window_days": {"min": 70, "max": 110},
+            }
+        ],
+    )
+    assert response.status_code == 401
+
+
+def test_design_time_batch_success(client, auth_token):
+    """Test batch design time calculation preserves request order."""
+    births = [TEST_BIRTH_JD_UT + 365.0, TEST_BIRTH_JD_UT, TEST_BIRTH_JD_UT + 180.0]
+    response = client.post(
+        "/v1/design-time/batch",
+        json=[
+            {
+                "birth_jd_ut": birth_jd_ut,
+                "sun_offset_deg": 88.0,
+                "search_window_days": {"min": 70, "max": 110},
+                "tolerance_deg": 0.01,
+                "max_iter": 80,
+            }
+            for birth_jd_ut in births
+        ],
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["birth_jd_ut"] for item in data] == births
+    for item in data:
+        assert item["delta_deg"] <= 0.01
+        assert item["design_jd_ut"] < item["birth_jd_ut"]
+    assert "X-AGPL-Source" in response.headers
+
+
+def test_design_time_batch_size_limit(client, auth_token):
+    """Test that empty and oversized batches are rejected."""
+    request = {
+        "birth_jd_ut": TEST_BIRTH_JD_UT,
+        "search_window_days": {"min": 70, "max": 110},
+    }
+    for size in (0, 1001):
+        response = client.post(
+            "/v1/design-time/batch",
+            json=[request] * size,
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 422
+
+
+def test_design_time_batch_reports_failing_index(client, auth_token):
+    """Test that a failing batch element is identified by its index."""
+    response = client.post(
+        "/v1/design-time/batch",
+        json=[
+            {
+                "birth_jd_ut": TEST_BIRTH_JD_UT,
+                "search_window_days": {"min": 70, "max": 110},
+            },
+            {
+                "birth_jd_ut": TEST_BIRTH_JD_UT,
+                "search_window_days": {"min": 110, "max": 70},  # Invalid: min > max
+            },
+        ],
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 400
+    data = response.json()
+    assert data["error"]["code"] == "bad_request"
+    assert data["error"]["details"]["index"] == 1
+
+
+def test_design_time_float_window(client, auth_token):
+    """Test that a float for an integer field is rejected in strict mode."""
+    response = client.post(
+        "/v1/design-time",
+        json={
+            "birth_jd_ut": TEST_BIRTH_JD_UT,
+            "search_window_days": {"min": 70.0, "max": 110},
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "validation_error"
@@ -1,10 +1,6 @@
 """Tests for houses calculation endpoint."""
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
 
 # Test Julian Day for 2000-01-01 12:00:00 UT
 TEST_JD_UT = 2451545.0
@@ -13,15 +9,7 @@ TEST_LAT = -23.5505
 TEST_LON = -46.6333
 
 
-@pytest.fixture
-def auth_token():
-    """Get auth token for tests."""
-    import os
-    os.environ["AGPL_SERVICE_API_KEYS"] = "test-token"
-    return "test-token"
-
-
-def test_houses_without_auth():
+def test_houses_without_auth(client):
     """Test that houses endpoint requires authentication."""
     response = client.post(
         "/v1/houses",
@@ -35,7 +23,7 @@ def test_houses_without_auth():
     assert response.status_code == 401
 
 
-def test_houses_placidus(auth_token):
+def test_houses_placidus(client, auth_token):
     """Test calculating houses with Placidus system."""
     response = client.post(
         "/v1/houses",
@@ -60,7 +48,7 @@ def test_houses_placidus(auth_token):
     assert "X-AGPL-Source" in response.headers
 
 
-def test_houses_cusps_normalized(auth_token):
+def test_houses_cusps_normalized(client, auth_token):
     """Test that all cusps are normalized to [0, 360)."""
     response = client.post(
         "/v1/houses",
@@ -78,7 +66,7 @@ def test_houses_cusps_normalized(auth_token):
         assert 0 <= cusp < 360
 
 
-def test_houses_unsupported_system(auth_token):
+def test_houses_unsupported_system(client, auth_token):
     """Test error for unsupported house system."""
     response = client.post(
         "/v1/houses",
@@ -96,11 +84,12 @@ def test_houses_unsupported_system(auth_token):
     assert data["error"]["code"] == "invalid_house_system"
 
 
-def test_houses_different_systems(auth_token):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_houses_different_systems(aclient, auth_token):
     """Test different house systems."""
     systems = ["P", "K", "R", "C", "E"]
     for system in systems:
-        response = client.post(
+        response = await aclient.post(
             "/v1/houses",
             json={
                 "jd_ut": TEST_JD_UT,
@@ -1,24 +1,12 @@
 """Tests for positions calculation endpoint."""
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
 
 # Test Julian Day for 2000-01-01 12:00:00 UT
 TEST_JD_UT = 2451545.0
 
 
-@pytest.fixture
-def auth_token():
-    """Get auth token for tests."""
-    import os
-    os.environ["AGPL_SERVICE_API_KEYS"] = "test-token"
-    return "test-token"
-
-
-def test_positions_without_auth():
+def test_positions_without_auth(client):
     """Test that positions endpoint requires authentication."""
     response = client.post(
         "/v1/positions",
@@ -30,7 +18,7 @@ def test_positions_without_auth():
     assert response.status_code == 401
 
 
-def test_positions_sun(auth_token):
+def test_positions_sun(client, auth_token):
     """Test calculating Sun position."""
     response = client.post(
         "/v1/positions",
@@ -48,7 +36,7 @@ def test_positions_sun(auth_token):
     assert "X-AGPL-Source" in response.headers
 
 
-def test_positions_multiple_bodies(auth_token):
+def test_positions_multiple_bodies(client, auth_token):
     """Test calculating multiple body positions."""
     response = client.post(
         "/v1/positions",
@@ -67,7 +55,7 @@ def test_positions_multiple_bodies(auth_token):
         assert 0 <= data["positions"][body] < 360
 
 
-def test_positions_all_bodies(auth_token):
+def test_positions_all_bodies(client, auth_token):
     """Test calculating all supported bodies."""
     bodies = [
         "Sun",
@@ -97,7 +85,7 @@ def test_positions_all_bodies(auth_token):
         assert 0 <= data["positions"][body] < 360
 
 
-def test_positions_unsupported_body(auth_token):
+def test_positions_unsupported_body(client, auth_token):
     """Test error for unsupported body."""
     response = client.post(
         "/v1/positions",
@@ -113,7 +101,7 @@ def test_positions_unsupported_body(auth_token):
     assert data["error"]["code"] == "unsupported_body"
 
 
-def test_positions_normalized_range(auth_token):
+def test_positions_normalized_range(client, auth_token):
     """Test that all positions are normalized to [0, 360)."""
     response = client.post(
         "/v1/positions",
@@ -130,7 +118,7 @@ def test_positions_normalized_range(auth_token):
         assert 0 <= position < 360
 
 
-def test_positions_meta(auth_token):
+def test_positions_meta(client, auth_token):
     """Test that response includes metadata."""
     response = client.post(
         "/v1/positions",
@@ -145,3 +133,95 @@ def test_positions_meta(auth_token):
     assert "meta" in data
     assert data["meta"]["engine"] == "swisseph"
     assert "sidereal" in data["meta"]
+
+
+def test_positions_batch_without_auth(client):
+    """Test that batch positions endpoint requires authentication."""
+    response = client.post(
+        "/v1/positions/batch",
+        json={
+            "jd_ut": [TEST_JD_UT],
+            "bodies": ["Sun"],
+        },
+    )
+    assert response.status_code == 401
+
+
+def test_positions_batch_matches_single(client, auth_token):
+    """Test that batch positions match single-time positions."""
+    jd_uts = [TEST_JD_UT, TEST_JD_UT + 1.0, TEST_JD_UT + 10.5]
+    bodies = ["Sun", "Moon", "Mars", "SouthNode"]
+    response = client.post(
+        "/v1/positions/batch",
+        json={
+            "jd_ut": jd_uts,
+            "bodies": bodies,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["jd_ut"] == jd_uts
+    assert data["meta"]["engine"] == "swisseph"
+    assert "X-AGPL-Source" in response.headers
+    for body in bodies:
+        assert len(data["positions"][body]) == len(jd_uts)
+
+    for i, jd_ut in enumerate(jd_uts):
+        single = client.post(
+            "/v1/positions",
+            json={
+                "jd_ut": jd_ut,
+                "bodies": bodies,
+            },
+            headers={"Authorization": f"Bearer {auth_token}"},
+        ).json()
+        for body in bodies:
+            assert data["positions"][body][i] == pytest.approx(single["positions"][body])
+
+
+def test_positions_batch_limits(client, auth_token):
+    """Test that oversized batches are rejected."""
+    for jd_uts, bodies in (
+        ([TEST_JD_UT], ["Sun"] * 65),  # Too many bodies
+        ([TEST_JD_UT] * 10000, ["Sun"] * 11),  # Too many calculations in total
+    ):
+        response = client.post(
+            "/v1/positions/batch",
+            json={
+                "jd_ut": jd_uts,
+                "bodies": bodies,
+            },
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 422
+        assert response.json()["error"]["code"] == "validation_error"
+
+
+def test_positions_string_jd_ut(client, auth_token):
+    """Test that a number sent as a string is rejected in strict mode."""
+    response = client.post(
+        "/v1/positions",
+        json={
+            "jd_ut": str(TEST_JD_UT),
+            "bodies": ["Sun"],
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "validation_error"
+
+
+def test_positions_unknown_field(client, auth_token):
+    """Test that unknown request fields are rejected."""
+    response = client.post(
+        "/v1/positions",
+        json={
+            "jd_ut": TEST_JD_UT,
+            "bodies": ["Sun"],
+            "unknown": True,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "validation_error"
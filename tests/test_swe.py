@@ -0,0 +1,76 @@
+"""Tests for the Swiss Ephemeris wrapper and its result caches."""
+
+import pytest
+import swisseph as swe
+
+from app.core.swe import (
+    _calc_ut_cached,
+    _sun_motion_cached,
+    calculate_positions,
+    calculate_sun_motion,
+    calculate_sun_position,
+    clear_caches,
+    initialize_ephemeris_path,
+)
+
+# Test Julian Day for 2000-01-01 12:00:00 UT
+TEST_JD_UT = 2451545.0
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start every test with empty result caches."""
+    initialize_ephemeris_path()
+    clear_caches()
+    yield
+    clear_caches()
+
+
+def test_sidereal_bypasses_calc_cache():
+    """Test that sidereal results never come from or go into the tropical cache."""
+    tropical = calculate_positions(TEST_JD_UT, ["Sun"])["Sun"]
+    fagan = calculate_positions(
+        TEST_JD_UT, ["Sun"], sidereal=True, ayanamsa=swe.SIDM_FAGAN_BRADLEY
+    )["Sun"]
+    fagan_ayanamsa = swe.get_ayanamsa_ut(TEST_JD_UT)
+    lahiri = calculate_positions(TEST_JD_UT, ["Sun"], sidereal=True, ayanamsa=swe.SIDM_LAHIRI)[
+        "Sun"
+    ]
+    lahiri_ayanamsa = swe.get_ayanamsa_ut(TEST_JD_UT)
+    tropical_again = calculate_positions(TEST_JD_UT, ["Sun"])["Sun"]
+
+    # Each sidereal result is the tropical longitude minus its own ayanamsa
+    assert fagan == pytest.approx((tropical - fagan_ayanamsa) % 360.0, abs=0.01)
+    assert lahiri == pytest.approx((tropical - lahiri_ayanamsa) % 360.0, abs=0.01)
+    assert fagan != pytest.approx(lahiri, abs=0.1)
+
+    # The tropical result is unchanged and served from the cache
+    assert tropical_again == tropical
+    info = _calc_ut_cached.cache_info()
+    assert info.currsize == 1
+    assert info.hits == 1
+
+
+def test_sun_motion_cache():
+    """Test that cached Sun longitude and speed match Swiss Ephemeris."""
+    xx, _ = swe.calc_ut(TEST_JD_UT, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)
+
+    assert calculate_sun_motion(TEST_JD_UT) == (xx[0], xx[3])
+    assert calculate_sun_position(TEST_JD_UT) == xx[0]
+
+    info = _sun_motion_cached.cache_info()
+    assert info.currsize == 1
+    assert info.hits == 1
+
+
+def test_clear_caches():
+    """Test that clear_caches empties both result caches."""
+    calculate_positions(TEST_JD_UT, ["Sun", "Moon"])
+    calculate_sun_motion(TEST_JD_UT)
+    assert _calc_ut_cached.cache_info().currsize == 2
+    assert _sun_motion_cached.cache_info().currsize == 1
+
+    clear_caches()
+
+    assert _calc_ut_cached.cache_info().currsize == 0
+    assert _sun_motion_cached.cache_info().currsize == 0